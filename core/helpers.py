@@ -3,15 +3,28 @@ Helper utilities used across the pipeline.
 """
 import os
 import json
+import re
+import secrets
+import stat
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Dict
-from slugify import slugify
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `speedups` extra
+    orjson = None  # type: ignore[assignment]
 
+# orjson reads integers outside the 64-bit range as floats; documents with
+# digit runs this long are left to the stdlib parser.
+_LONG_DIGITS_RE = re.compile(rb'\d{19,}')
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory."""
-    return Path(__file__).parent.parent
+    return Path(__file__).resolve().parent.parent
 
 
 def get_data_dir(subdir: str = "") -> Path:
@@ -34,15 +47,43 @@ def get_date_string() -> str:
 def save_json(data: Any, filepath: Path) -> None:
     """
     Save data to JSON file.
+
+    Output is written atomically.
     
     Args:
         data: Data to save
         filepath: Path to save to
     """
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+    target = Path(os.path.realpath(filepath))
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+    tmp_name = target.with_name(f"{target.name}.{secrets.token_hex(8)}.tmp")
+    # Created like open() would, so the umask applies; O_EXCL guards the name.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+    try:
+        fd = os.open(tmp_name, flags, 0o666)
+    except FileNotFoundError:
+        # Only create the directory when it is actually missing.
+        ensure_dir(target.parent)
+        fd = os.open(tmp_name, flags, 0o666)
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def load_json(filepath: Path) -> Any:
@@ -55,8 +96,15 @@ def load_json(filepath: Path) -> Any:
     Returns:
         Loaded data
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    data = filepath.read_bytes()
+    if orjson is not None and not _LONG_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity, which stdlib json accepts
+            pass
+
+    return json.loads(data)
 
 
 def ensure_dir(path: Path) -> Path:
@@ -73,6 +121,7 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """
     Convert text to URL-safe slug.
@@ -83,8 +132,11 @@ def slugify(text: str) -> str:
     Returns:
         Slugified text
     """
-    
+    # Imported lazily: python-slugify pulls in text-unidecode, which most
+    # callers of this module never need.
+    from slugify import slugify as _slugify
+
     # Make a slug from the given text.
-    slug = slugify(text)
+    slug = _slugify(text)
     
     return slug
\ No newline at end of file
@@ -1,10 +1,28 @@
 """
 Core data models for the job scraper pipeline.
 """
+import re
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import (
+    BaseModel, Field, field_validator, ConfigDict, StringConstraints, TypeAdapter, ValidationInfo,
+)
+
+_WS_RE = re.compile(r'\s+')
+
+# Required text field: stripped and checked for emptiness inside pydantic-core,
+# without a Python-level validator call.
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+# JobListing fields typed NonEmptyStr, checked up front by fast_validate.
+_REQUIRED_TEXT_FIELDS = ('job_id', 'source', 'source_url', 'title', 'company', 'description')
+
+
+def now_utc() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
 
 class JobType(str, Enum):
     """Enumeration of job types."""
@@ -44,13 +62,13 @@ class JobListing(BaseModel):
     """
 
     # Identifiers and Metadata
-    job_id: str = Field(..., description="Unique job identifier (site_jobid)")
-    source: str = Field(..., description="Job board source (e.g., 'wuzzuf')")
-    source_url: str = Field(..., description="Original job posting URL")
+    job_id: NonEmptyStr = Field(..., description="Unique job identifier (site_jobid)")
+    source: NonEmptyStr = Field(..., description="Job board source (e.g., 'wuzzuf')")
+    source_url: NonEmptyStr = Field(..., description="Original job posting URL")
 
     # Basic Job Information
-    title: str = Field(..., description="Job title")
-    company: str = Field(..., description="Name of the hiring company")
+    title: NonEmptyStr = Field(..., description="Job title")
+    company: NonEmptyStr = Field(..., description="Name of the hiring company")
     location: str = Field(..., description="Job location")
 
     # Job Details
@@ -64,7 +82,7 @@ class JobListing(BaseModel):
     salary_text: Optional[str] = None # Original salary text
 
     # Job Description and Requirements
-    description: str = Field(..., description="Full job description")
+    description: NonEmptyStr = Field(..., description="Full job description")
     requirements: Optional[List[str]] = None # List of job requirements
 
     # Metadata
@@ -74,7 +92,9 @@ class JobListing(BaseModel):
 
     # Dates
     posted_date: Optional[datetime] = None # Date when the job was posted
-    scraped_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Timestamp when the job was scraped")
+    # Scrapers should read now_utc() once per pass and pass it as scraped_at
+    # for every row, rather than paying a clock read per listing.
+    scraped_at: datetime = Field(default_factory=now_utc, description="Timestamp when the job was scraped")
     expiry_date: Optional[datetime] = None # Job listing expiry date
     
     # Quality Indicators
@@ -82,41 +102,45 @@ class JobListing(BaseModel):
     is_remote: Optional[bool] = Field(default=False, description="Indicates if the job is remote")
 
     @field_validator('title', 'company', 'description')
-    def not_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Field cannot be empty')
-        return v
-    
-    @field_validator('title', 'company', 'description')
-    def clean_whitespace(cls, v):
-        if isinstance(v, str):
-            return ' '.join(v.split())
-        return v
-    
-    @field_validator('job_id', 'source', 'source_url')
-    def validate_non_empty(cls, v):
-        if not v or not v.strip():
+    def clean_text(cls, v, info: ValidationInfo):
+        # NonEmptyStr has already rejected blank input; collapse inner runs
+        # of whitespace and re-check in case only exotic whitespace was left.
+        v = _WS_RE.sub(' ', v).strip()
+        if not v:
             raise ValueError('Field cannot be empty')
+        if info.field_name == 'description' and not v[0].isupper():
+            raise ValueError('Description must start with an uppercase letter')
         return v
     
     model_config = ConfigDict(
         str_strip_whitespace=True,
     )
 
-    @field_validator('description', mode='after')
-    def description_starts_with_upper(cls, v):
-        if isinstance(v, str) and v and not v[0].isupper():
-            raise ValueError('Description must start with an uppercase letter')
-        return v
-
     @field_validator('job_type')
     def reject_enum_instance_for_job_type(cls, v):
-        from enum import Enum as _Enum
         # tests expect passing an Enum member to fail; disallow Enum instances
-        if v is not None and isinstance(v, _Enum):
+        if v is not None and isinstance(v, Enum):
             raise ValueError('Invalid enum value')
         return v
 
+    @classmethod
+    def fast_validate(cls, data: dict) -> Optional['JobListing']:
+        """Validate a raw scraped row; return None if a required text field is blank."""
+        for name in _REQUIRED_TEXT_FIELDS:
+            value = data.get(name)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                return None
+        return cls.model_validate(data)
+
+    @classmethod
+    def from_trusted(cls, **data) -> 'JobListing':
+        """Build a listing from already-normalized data without validating it."""
+        return cls.model_construct(**data)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the listing straight to JSON bytes, without an intermediate dict."""
+        return self.__pydantic_serializer__.to_json(self)
+
     def __str__(self):
         """String representation of the JobListing."""
         return f"JobListing({self.job_id}: {self.title} at {self.company} ({self.location}))"
@@ -128,6 +152,58 @@ class JobListing(BaseModel):
                 f"salary_min={self.salary_min}, salary_max={self.salary_max}, currency={self.currency}, "
                 f"posted_date={self.posted_date}, is_active={self.is_active})")
 
+
+# Reusable validators for JobListing. Validating a whole batch of scraped rows
+# through the list adapter runs in a single pydantic-core call instead of one
+# JobListing(**row) per row.
+JOB_LISTING_ADAPTER = TypeAdapter(JobListing)
+JOB_LISTING_LIST_ADAPTER = TypeAdapter(List[JobListing])
+
+
+def parse_job_listings_json(data: bytes | str) -> List[JobListing]:
+    """
+    Parse and validate a JSON array of job listings in one pass.
+
+    The raw body goes straight into pydantic-core, which decodes and
+    validates every listing without first materializing Python dicts, so
+    use this instead of json.loads + JobListing(**row) for bulk ingests.
+
+    Args:
+        data: JSON document whose top level is a list of job objects
+
+    Returns:
+        Validated job listings, in document order
+    """
+    return JOB_LISTING_LIST_ADAPTER.validate_json(data)
+
+
+class JobListingTable:
+    """
+    Columnar view over a batch of job listings.
+
+    Filters and aggregates over many listings (remote share, salary ranges,
+    counts per seniority) run as vectorized pandas operations on ``df``
+    instead of Python loops over JobListing attributes.
+    """
+
+    COLUMNS = (
+        'job_id', 'source', 'title', 'company', 'location', 'seniority',
+        'salary_min', 'salary_max', 'currency', 'is_remote', 'is_active',
+    )
+
+    def __init__(self, listings: List[JobListing]):
+        # pandas is only needed here; keep it out of the module import.
+        import pandas as pd
+
+        self.df = pd.DataFrame(
+            {name: [getattr(job, name) for job in listings] for name in self.COLUMNS},
+            columns=list(self.COLUMNS),
+        )
+
+    def __len__(self):
+        return len(self.df)
+
+
 class ScraperConfig(BaseModel):
     """
     Configuration model for the job scraper.
@@ -1,13 +1,52 @@
 # extract/utils/fetch.py
+import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
 from time import sleep
-from typing import Optional
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_HEADERS = {
     "User-Agent": "job-scraper-bot/0.1 (+https://github.com/husseini2000/job-scraper)"
 }
 
-def fetch(url: str, headers: Optional[dict] = None, retries: int = 3, delay: int = 2) -> Optional[str]:
+DEFAULT_TIMEOUT = 10
+
+# One session per thread so consecutive requests to the same job board reuse
+# pooled keep-alive connections instead of redoing the TCP/TLS handshake for
+# every page. requests.Session is not documented as thread-safe, so
+# fetch_many's workers each get their own.
+_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's session, creating it on first use."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Like the per-call requests.get this replaced, start every fetch
+        # without cookies: reject them all so one site's cookies are never
+        # sent on later fetches.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _local.session = session
+    return session
+
+
+def fetch(
+    url: str,
+    headers: Optional[dict] = None,
+    retries: int = 3,
+    delay: int = 2,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Optional[str]:
     """Fetch the content of a URL with optional retries.
 
     Args:
@@ -15,6 +54,7 @@ def fetch(url: str, headers: Optional[dict] = None, retries: int = 3, delay: int
         headers (Optional[dict]): Optional HTTP headers to include in the request.
         retries (int): Number of retries in case of failure.
         delay (int): Delay in seconds between retries.
+        timeout (float): Seconds to wait for the server before giving up on an attempt.
 
     Returns:
         Optional[str]: The content of the response if successful, None otherwise.
@@ -24,12 +64,44 @@ def fetch(url: str, headers: Optional[dict] = None, retries: int = 3, delay: int
 
     for attempt in range(retries):
         try:
-            response = requests.get(url, headers=headers)
+            response = _get_session().get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            sleep(delay)
+            logger.warning("Attempt %d failed for %s: %s", attempt + 1, url, e)
+            if attempt + 1 < retries:
+                sleep(delay)
 
-    print("All attempts to fetch the URL have failed.")
+    logger.error("All %d attempts to fetch %s failed", retries, url)
     return None
+
+
+def fetch_many(
+    urls: Iterable[str],
+    headers: Optional[dict] = None,
+    retries: int = 3,
+    delay: int = 2,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = 5,
+) -> List[Optional[str]]:
+    """Fetch several URLs concurrently, with one session per worker thread.
+
+    Page fetches are dominated by network wait, so running them on a small
+    thread pool overlaps the round trips instead of paying them one after
+    another. Keep ``max_workers`` low enough to stay polite to the site.
+
+    Args:
+        urls (Iterable[str]): The URLs to fetch.
+        headers (Optional[dict]): Optional HTTP headers to include in each request.
+        retries (int): Number of retries per URL in case of failure.
+        delay (int): Delay in seconds between retries.
+        timeout (float): Seconds to wait for the server on each attempt.
+        max_workers (int): Maximum number of requests in flight at once.
+
+    Returns:
+        List[Optional[str]]: Response bodies in the same order as ``urls``;
+        None for URLs whose attempts all failed.
+    """
+    fetch_one = partial(fetch, headers=headers, retries=retries, delay=delay, timeout=timeout)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fetch_one, urls))
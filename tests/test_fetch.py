@@ -0,0 +1,112 @@
+"""
+Unit tests for the fetch utility.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+
+from extract.utils import fetch as fetch_module
+from extract.utils.fetch import fetch, fetch_many
+
+
+class FakeResponse:
+    def __init__(self, text: str, status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    def __init__(self, get):
+        self.get = get
+
+
+def test_fetch_returns_text(monkeypatch):
+    """Test that a successful response body is returned."""
+    calls = []
+
+    def fake_get(url, headers=None, timeout=None):
+        calls.append((url, timeout))
+        return FakeResponse("<html>jobs</html>")
+
+    monkeypatch.setattr(fetch_module, "_get_session", lambda: FakeSession(fake_get))
+
+    assert fetch("https://example.com/jobs", timeout=5) == "<html>jobs</html>"
+    assert calls == [("https://example.com/jobs", 5)]
+
+
+def test_fetch_retries_then_gives_up(monkeypatch):
+    """Test that failures are retried and None is returned at the end."""
+    attempts = []
+
+    def fake_get(url, headers=None, timeout=None):
+        attempts.append(url)
+        return FakeResponse("", status_code=503)
+
+    monkeypatch.setattr(fetch_module, "_get_session", lambda: FakeSession(fake_get))
+    monkeypatch.setattr(fetch_module, "sleep", lambda seconds: None)
+
+    assert fetch("https://example.com/jobs", retries=3) is None
+    assert len(attempts) == 3
+
+
+def test_fetch_many_preserves_order(monkeypatch):
+    """Test that concurrent fetches come back in input order."""
+    def fake_get(url, headers=None, timeout=None):
+        if url.endswith("/2"):
+            return FakeResponse("", status_code=404)
+        return FakeResponse(f"page {url[-1]}")
+
+    monkeypatch.setattr(fetch_module, "_get_session", lambda: FakeSession(fake_get))
+    monkeypatch.setattr(fetch_module, "sleep", lambda seconds: None)
+
+    urls = [f"https://example.com/jobs/{i}" for i in range(4)]
+
+    assert fetch_many(urls, retries=1) == ["page 0", "page 1", None, "page 3"]
+
+
+def test_fetch_does_not_keep_cookies():
+    """Test that cookies set by one response are not sent on later fetches."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append(self.headers.get("Cookie"))
+            body = b"ok"
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/jobs"
+        assert fetch(url, retries=1) == "ok"
+        assert fetch(url, retries=1) == "ok"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert received == [None, None]
+
+
+def test_fetch_uses_one_session_per_thread():
+    """Test that each thread reuses its own session."""
+    session = fetch_module._get_session()
+    assert fetch_module._get_session() is session
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(fetch_module._get_session).result()
+
+    assert other is not session
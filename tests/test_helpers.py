@@ -0,0 +1,137 @@
+"""
+Unit tests for the helpers module.
+"""
+import math
+import os
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core import helpers
+from core.helpers import ensure_dir, load_json, save_json
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_and_load_json(tmp_path, monkeypatch, use_orjson):
+    """Test that data round-trips through save_json/load_json."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(helpers, "orjson", None)
+    filepath = tmp_path / "nested" / "data.json"
+    data = {"title": "Data Engineer", "skills": ["python", "sql"], "city": "القاهرة"}
+
+    save_json(data, filepath)
+
+    assert load_json(filepath) == data
+    assert [p.name for p in filepath.parent.iterdir()] == ["data.json"]
+
+
+def test_load_json_keeps_nan_and_big_ints(tmp_path):
+    """Test that values orjson can't read exactly still load like stdlib json."""
+    pytest.importorskip("orjson")
+    filepath = tmp_path / "data.json"
+
+    save_json({"salary": float("nan"), "big": 2 ** 70, "small": -(2 ** 64)}, filepath)
+    loaded = load_json(filepath)
+
+    assert math.isnan(loaded["salary"])
+    assert loaded["big"] == 2 ** 70
+    assert loaded["small"] == -(2 ** 64)
+
+
+def test_save_json_overwrites_existing_file(tmp_path):
+    """Test that saving over an existing file replaces its contents."""
+    filepath = tmp_path / "data.json"
+    save_json({"run": 1, "jobs": list(range(100))}, filepath)
+
+    save_json({"run": 2}, filepath)
+
+    assert load_json(filepath) == {"run": 2}
+
+
+def test_save_json_recreates_removed_directory(tmp_path):
+    """Test that save_json still works after its directory was removed."""
+    directory = tmp_path / "out"
+    save_json({"run": 1}, directory / "data.json")
+    shutil.rmtree(directory)
+
+    save_json({"run": 2}, directory / "data.json")
+
+    assert load_json(directory / "data.json") == {"run": 2}
+
+
+def test_ensure_dir(tmp_path):
+    """Test that ensure_dir creates the directory and returns it."""
+    directory = tmp_path / "a" / "b"
+
+    assert ensure_dir(directory) == directory
+    assert directory.is_dir()
+
+    shutil.rmtree(tmp_path / "a")
+    ensure_dir(directory)
+    assert directory.is_dir()
+
+
+def test_slugify():
+    """Test converting text to a URL-safe slug."""
+    assert helpers.slugify("Senior Data Engineer") == "senior-data-engineer"
+    assert helpers.slugify("  C++ / Python  ") == "c-python"
+
+
+def test_save_json_concurrent_writers(tmp_path):
+    """Test that threads saving to the same path don't clobber each other's temp files."""
+    filepath = tmp_path / "data.json"
+
+    def write(i):
+        save_json({"writer": i}, filepath)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write, range(200)))
+
+    assert load_json(filepath)["writer"] in range(200)
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_save_json_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    """Test that a failed save leaves neither a temp file nor a partial target."""
+    filepath = tmp_path / "data.json"
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(helpers.os, "replace", failing_replace)
+
+    with pytest.raises(OSError):
+        save_json({"run": 1}, filepath)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_save_json_keeps_existing_file_mode(tmp_path):
+    """Test that overwriting a private file keeps it private."""
+    filepath = tmp_path / "data.json"
+    save_json({"run": 1}, filepath)
+    os.chmod(filepath, 0o600)
+
+    save_json({"run": 2}, filepath)
+
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o600
+    assert load_json(filepath) == {"run": 2}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+def test_save_json_writes_through_symlink(tmp_path):
+    """Test that saving to a symlink updates the file it points to."""
+    real = tmp_path / "real.json"
+    save_json({"run": 1}, real)
+    link = tmp_path / "link.json"
+    link.symlink_to(real)
+
+    save_json({"run": 2}, link)
+
+    assert link.is_symlink()
+    assert load_json(real) == {"run": 2}
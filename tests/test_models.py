@@ -1,10 +1,15 @@
 """
 Unit tests for the models module.
 """
+import json
+import pandas as pd
 import pytest
 from datetime import datetime, timezone, timedelta
 
-from core.models import JobListing, JobType, SeniorityLevel, Currency
+from core.models import (
+    JobListing, JobType, SeniorityLevel, Currency, JOB_LISTING_LIST_ADAPTER,
+    JobListingTable, parse_job_listings_json,
+)
 from pydantic import ValidationError
 
 def test_job_listing_creation():
@@ -144,4 +149,145 @@ def test_job_listing_string_representation():
     
     repr_str = repr(job)
     assert "JobListing" in repr_str
-    assert "test_123" in repr_str
\ No newline at end of file
+    assert "test_123" in repr_str
+
+
+def test_job_listing_batch_validation():
+    """Test validating a batch of raw job dicts in one call."""
+    rows = [
+        {
+            "job_id": f"test_{i}",
+            "source": "test",
+            "source_url": f"https://test.com/{i}",
+            "title": "Python Dev",
+            "company": "PyCompany",
+            "location": "Cairo",
+            "description": "Code Python",
+        }
+        for i in range(3)
+    ]
+
+    jobs = JOB_LISTING_LIST_ADAPTER.validate_python(rows)
+
+    assert len(jobs) == 3
+    assert all(isinstance(job, JobListing) for job in jobs)
+    assert [job.job_id for job in jobs] == ["test_0", "test_1", "test_2"]
+
+
+def test_job_listing_to_json_bytes():
+    """Test serializing a job listing directly to JSON bytes."""
+    job = JobListing(
+        job_id="test_123",
+        source="test",
+        source_url="https://test.com",
+        title="Python Dev",
+        company="PyCompany",
+        location="Cairo",
+        description="Code Python",
+        currency=Currency.EGP,
+    )
+
+    data = job.to_json_bytes()
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == json.loads(job.model_dump_json())
+    assert json.loads(data)["currency"] == "EGP"
+
+
+def test_job_listing_table_columns():
+    """Test building a columnar table from job listings."""
+    jobs = [
+        JobListing(
+            job_id=f"test_{i}",
+            source="test",
+            source_url=f"https://test.com/{i}",
+            title="Data Engineer",
+            company="DataCo",
+            location="Dubai",
+            description="Work with big data",
+            salary_min=1000 * (i + 1),
+            is_remote=i % 2 == 0,
+        )
+        for i in range(4)
+    ]
+
+    table = JobListingTable(jobs)
+
+    assert len(table) == 4
+    assert isinstance(table.df, pd.DataFrame)
+    assert list(table.df.columns) == list(JobListingTable.COLUMNS)
+    assert table.df["is_remote"].sum() == 2
+    assert table.df["salary_min"].mean() == 2500
+
+
+def test_job_listing_from_trusted():
+    """Test building a job listing from pre-normalized data."""
+    data = dict(
+        job_id="test_123",
+        source="test",
+        source_url="https://test.com",
+        title="Python Dev",
+        company="PyCompany",
+        location="Cairo",
+        description="Code Python",
+    )
+
+    job = JobListing.from_trusted(**data)
+
+    assert job == JobListing(**data, scraped_at=job.scraped_at)
+    assert job.is_active is True
+    assert isinstance(job.scraped_at, datetime)
+
+
+def test_job_listing_fast_validate():
+    """Test that fast_validate skips rows with blank required fields."""
+    row = {
+        "job_id": "test_123",
+        "source": "test",
+        "source_url": "https://test.com",
+        "title": "Python Dev",
+        "company": "PyCompany",
+        "location": "Cairo",
+        "description": "Code Python",
+    }
+
+    job = JobListing.fast_validate(row)
+    assert isinstance(job, JobListing)
+    assert job.job_id == "test_123"
+
+    assert JobListing.fast_validate({**row, "title": "   "}) is None
+    assert JobListing.fast_validate({k: v for k, v in row.items() if k != "job_id"}) is None
+
+    with pytest.raises(ValidationError):
+        JobListing.fast_validate({**row, "description": "lowercase start"})
+
+    # Non-string values are left to pydantic, falsy or not
+    for bad_id in (0, 5):
+        with pytest.raises(ValidationError):
+            JobListing.fast_validate({**row, "job_id": bad_id})
+
+
+def test_parse_job_listings_json():
+    """Test parsing a JSON array of job listings in one call."""
+    body = json.dumps([
+        {
+            "job_id": f"test_{i}",
+            "source": "test",
+            "source_url": f"https://test.com/{i}",
+            "title": "  Python   Dev ",
+            "company": "PyCompany",
+            "location": "Cairo",
+            "description": "Code Python",
+            "currency": "EGP",
+        }
+        for i in range(2)
+    ]).encode()
+
+    jobs = parse_job_listings_json(body)
+
+    assert [job.job_id for job in jobs] == ["test_0", "test_1"]
+    assert jobs[0].title == "Python Dev"
+    assert jobs[0].currency == Currency.EGP
+
+    with pytest.raises(ValidationError):
+        parse_job_listings_json(b'[{"job_id": "x"}]')